@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -8,11 +9,13 @@ def is_frozen() -> bool:
     return bool(getattr(sys, "frozen", False))
 
 
+@lru_cache(maxsize=1)
 def base_path() -> Path:
     """Return the base path for bundled resources (assets) depending on runtime.
 
     - In PyInstaller onefile, resources are extracted to sys._MEIPASS.
     - In dev, use project root (…/kmc-invoice).
+    The runtime cannot change within a process, so the result is cached.
     """
     if is_frozen():
         meipass = getattr(sys, "_MEIPASS", None)
@@ -21,8 +24,12 @@ def base_path() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
+@lru_cache(maxsize=64)
 def resource_path(rel: str | Path) -> Path:
-    """Resolve a resource path (e.g., 'assets/logo.png') for current runtime."""
+    """Resolve a resource path (e.g., 'assets/logo.png') for current runtime.
+
+    Cached per relative path; the returned Path is immutable, so sharing it is safe.
+    """
     rel = Path(rel)
     return base_path() / rel
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 import json
@@ -68,13 +69,24 @@ def load_settings(path: Optional[Union[str, Path]] = None) -> Settings:
 		return settings
 
 	try:
-		with p.open("r", encoding="utf-8") as f:
-			raw: Dict[str, Any] = json.load(f)
+		st = p.stat()
+		raw = _read_settings_json(str(p), st.st_mtime_ns, st.st_size)
 	except (json.JSONDecodeError, OSError):
 		# If unreadable/corrupt, fall back to defaults (do not overwrite automatically)
 		return Settings()
 
-	return Settings.from_dict(raw if isinstance(raw, dict) else {})
+	return Settings.from_dict(raw)
+
+
+@lru_cache(maxsize=4)
+def _read_settings_json(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+	"""Parse settings.json; cached until the file's mtime or size changes.
+
+	Callers must treat the returned dict as read-only (from_dict copies it).
+	"""
+	with open(path, "r", encoding="utf-8") as f:
+		raw = json.load(f)
+	return raw if isinstance(raw, dict) else {}
 
 
 def save_settings(settings: Settings, path: Optional[Union[str, Path]] = None) -> None:
@@ -87,4 +99,6 @@ def save_settings(settings: Settings, path: Optional[Union[str, Path]] = None) -
 		json.dump(settings.to_dict(), f, indent=2, ensure_ascii=False)
 		f.write("\n")
 	tmp.replace(p)
+	# Coarse filesystem timestamps could hide this write from the mtime key
+	_read_settings_json.cache_clear()
 
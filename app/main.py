@@ -18,6 +18,7 @@ import logging
 logger = logging.getLogger(__name__)
 from app.core.numbering import bump_sequence_to_at_least, peek_next_invoice_number
 from app.styles.tokens import Metrics
+from app.core.currency import sum_money
 import json, time
 
 SAVE_DIR = Path.home() / "Documents" / "KMC Invoices"
@@ -54,7 +55,9 @@ def _save_draft_to_db(win) -> Dict[str, Any]:
     from datetime import date as _date
     inv_date = _date(qd.year(), qd.month(), qd.day())
     items = _collect_items(win)
-    total = sum(i.get("amount", 0) for i in items)
+    # Sum of the rounded line amounts, so it matches the rows the PDF table prints; it can
+    # differ by a cent from Invoice.total, which the repository sums from unrounded qty*rate
+    total = float(sum_money(i.get("amount", 0) or 0 for i in items))
     dto = {
         "number": win.inv_number.text().strip(),
         "date": inv_date,
@@ -226,14 +229,7 @@ def main() -> None:
             except Exception:
                 logger.exception("Failed to refresh UI settings")
 
-    # Initialize invoice number on load (peek next)
-    try:
-        from app.data.db import get_session
-        with get_session() as s:
-            win.inv_number.setText(peek_next_invoice_number(settings.invoice_prefix, s))
-    except Exception:
-        # Fallback to default invoice number if database access fails
-        win.inv_number.setText(f"{settings.invoice_prefix}0001")
+    # The editor peeks the next invoice number itself once the event loop starts
 
     # Wire footer buttons
     try:
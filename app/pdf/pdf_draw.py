@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import datetime as _dt
+import math
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, BinaryIO, Dict, Iterable, List, NamedTuple, Tuple
 
 from reportlab.platypus import Table, TableStyle, SimpleDocTemplate, Spacer
 from reportlab.lib.pagesizes import A4, LETTER
@@ -14,7 +18,7 @@ from reportlab.lib.utils import ImageReader
 
 from app.core.paths import resource_path
 from app.core.currency import round_money, fmt_money, to_decimal, round_money_dec, sum_money
-from app.pdf.table_layout import build_invoice_table
+from app.pdf.table_layout import build_invoice_table, estimate_height
 
 
 # ===== Layout constants (tweak here) =====
@@ -86,19 +90,44 @@ GRID_COLOR = BRAND                  # grid lines use brand color as requested
 FOOTER_SHIFT = 16 * mm  # Move footer up to eliminate gap between table and footer
 SIGN_BOX_EXTRA_SHIFT = 0 * mm
 
+# Derived positions (fixed for the page size, so computed once at import)
+CONTENT_RIGHT = PAGE_WIDTH - MARGIN_RIGHT
+CONTENT_WIDTH = PAGE_WIDTH - MARGIN_LEFT - MARGIN_RIGHT
+CENTER_X = PAGE_WIDTH / 2
+HEADER_TOP_Y = PAGE_HEIGHT - MARGIN_TOP
+HEADER_IMG_H = max(LOGO_HEIGHT, RIGHT_LOGO_HEIGHT)
+HEADER_BASELINE_Y = HEADER_TOP_Y - (HEADER_IMG_H * 0.45)
+HEADER_RULE_Y = HEADER_TOP_Y - HEADER_IMG_H - 3 * mm
+RIGHT_LOGO_X = CONTENT_RIGHT - RIGHT_LOGO_WIDTH
+INFO_LABEL_RIGHT_X = CONTENT_RIGHT - (27 * mm)
+INFO_VALUE_RIGHT_X = CONTENT_RIGHT - (1 * mm)
+FOOTER_TEXT_BASE_Y = (MARGIN_BOTTOM - FOOTER_SHIFT) + 6 + (1 * mm)
+SIGN_BOX_X = CONTENT_RIGHT - SIGN_BOX_W
+SIGN_BOX_Y = MARGIN_BOTTOM - FOOTER_SHIFT - SIGN_BOX_EXTRA_SHIFT
+
 
 # ===== Helpers =====
+@lru_cache(maxsize=1)
 def _register_fonts() -> Tuple[str, str]:
-    """Return (regular_font_name, bold_font_name)."""
+    """Return (regular_font_name, bold_font_name).
+
+    Fonts are registered process-wide by ReportLab, so the TTFs are parsed
+    once and later invoices reuse the cached result.
+    """
     regular = "Helvetica"
     bold = "Helvetica-Bold"
     try:
+        registered = set(pdfmetrics.getRegisteredFontNames())
         reg = resource_path("assets/fonts/NotoSans-Regular.ttf")
         bld = resource_path("assets/fonts/NotoSans-Bold.ttf")
-        if reg.exists():
+        if "NotoSans" in registered:
+            regular = "NotoSans"
+        elif reg.exists():
             pdfmetrics.registerFont(TTFont("NotoSans", str(reg)))
             regular = "NotoSans"
-        if bld.exists():
+        if "NotoSans-Bold" in registered:
+            bold = "NotoSans-Bold"
+        elif bld.exists():
             pdfmetrics.registerFont(TTFont("NotoSans-Bold", str(bld)))
             bold = "NotoSans-Bold"
     except Exception:
@@ -107,40 +136,9 @@ def _register_fonts() -> Tuple[str, str]:
     return regular, bold
 
 
-def _footer_text_top_y(data: Dict[str, Any]) -> float:
-    """Compute the Y position of the top line of the footer text block.
-
-    Mirrors the logic in _draw_footer so we can bottom-align the table just above it.
-    """
-    # Build the same lines list used by _draw_footer
-    biz = data.get("business", {}) if isinstance(data.get("business"), dict) else {}
-    settings = data.get("settings", {}) if isinstance(data.get("settings"), dict) else {}
-    permit = biz.get("permit", "") or settings.get("permit", "")
-    pan = biz.get("pan", "") or settings.get("pan", "")
-    cheque_to = biz.get("cheque_to", "") or settings.get("cheque_to", "") or biz.get("chequeTo", "")
-    mobile = settings.get("phone", "") or biz.get("phone", "")
-
-    lines: List[str] = []
-    if permit:
-        lines.append(f"Gujarat Gov. Permit No: {permit}")
-    if pan:
-        lines.append(f"PAN No: {pan}")
-    if cheque_to:
-        lines.append("Please issue the Cheque in the Name of:")
-        lines.append(str(cheque_to).upper())
-    if mobile:
-        lines.append(f"Mobile No: {mobile}")
-
-    gap = 11
-    # Matches _draw_footer: (MARGIN_BOTTOM - FOOTER_SHIFT) + 6 + 1mm + gap*(len(lines)-1)
-    return (MARGIN_BOTTOM - FOOTER_SHIFT) + 6 + (1 * mm) + gap * (max(0, len(lines) - 1))
-
-
 def _fmt_date(val: Any) -> str:
     # Expecting datetime.date; accept string fallback
     try:
-        import datetime as _dt
-
         if isinstance(val, (_dt.date, _dt.datetime)):
             return val.strftime("%d-%m-%Y")
     except Exception:
@@ -148,14 +146,92 @@ def _fmt_date(val: Any) -> str:
     return str(val) if val is not None else ""
 
 
-def _get(d: Dict[str, Any], path: str, default: Any = "") -> Any:
-    cur: Any = d
-    for part in path.split("."):
-        if isinstance(cur, dict) and part in cur:
-            cur = cur[part]
-        else:
-            return default
-    return cur
+def _footer_text_top_y(line_count: int) -> float:
+    """Compute the Y position of the top line of the footer text block.
+
+    Shared by _draw_footer and the table layout so we can bottom-align the table just above it.
+    """
+    gap = 11
+    # (MARGIN_BOTTOM - FOOTER_SHIFT) + 6 + 1mm + gap*(len(lines)-1)
+    return FOOTER_TEXT_BASE_Y + gap * (max(0, line_count - 1))
+
+
+class _InvoiceCtx(NamedTuple):
+    """Per-invoice values resolved once from the raw data dict."""
+    author: str
+    title: str
+    owner: str
+    service_title: str
+    invoice_number: str
+    invoice_date: str
+    footer_lines: Tuple[str, ...]
+    footer_text_top: float
+    bill_to_lines: Tuple[str, ...]
+    logo_path: Any
+    right_logo_path: Any
+    signature_path: Any
+
+
+def _normalize_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a shallow copy of data with every section present and well-typed.
+
+    Missing or non-dict sections become {} and items becomes a list, so the
+    drawing code can index sections directly without isinstance checks.
+    """
+    norm = dict(data)
+    for key in ("customer", "invoice", "settings", "business"):
+        section = data.get(key)
+        norm[key] = section if isinstance(section, dict) else {}
+    norm["items"] = list(data.get("items", []) or [])
+    return norm
+
+
+def _precompute(data: Dict[str, Any]) -> _InvoiceCtx:
+    """Resolve per-invoice values from data already passed through _normalize_data."""
+    settings = data["settings"]
+    biz = data["business"]
+    inv = data["invoice"]
+    cust = data["customer"]
+    # Set author from business_name if provided in settings or business
+    author = settings.get("business_name") or biz.get("name") or "KMC Invoice"
+
+    permit = biz.get("permit", "") or settings.get("permit", "") or inv.get("permit", "")
+    pan = biz.get("pan", "") or settings.get("pan", "") or inv.get("pan", "")
+    cheque_to = biz.get("cheque_to", "") or settings.get("cheque_to", "") or biz.get("chequeTo", "")
+    mobile = settings.get("phone", "") or biz.get("phone", "")
+    # Footer lines in the specified order and wording (drawn top-to-bottom)
+    footer_lines: List[str] = []
+    if permit:
+        footer_lines.append(f"Gujarat Gov. Permit No: {permit}")
+    if pan:
+        footer_lines.append(f"PAN No: {pan}")
+    if cheque_to:
+        footer_lines.append("Please issue the Cheque in the Name of:")
+        footer_lines.append(str(cheque_to).upper())
+    if mobile:
+        footer_lines.append(f"Mobile No: {mobile}")
+
+    # BILL TO block: name always occupies a line, phone and address lines only when present
+    bill_to_lines: List[str] = [cust.get("name", "")]
+    phone = cust.get("phone", "")
+    if phone:
+        bill_to_lines.append(phone)
+    bill_to_lines.extend(ln for ln in str(cust.get("address", "") or "").splitlines() if ln)
+
+    return _InvoiceCtx(
+        author=str(author),
+        title=f"Invoice {str(inv.get('number', ''))}",
+        owner=settings.get("owner", ""),
+        service_title=settings.get("service_title", ""),
+        invoice_number=str(inv.get("number", "")),
+        invoice_date=str(_fmt_date(inv.get("date"))),
+        footer_lines=tuple(footer_lines),
+        footer_text_top=_footer_text_top_y(len(footer_lines)),
+        bill_to_lines=tuple(bill_to_lines),
+        logo_path=settings.get("logo_path"),
+        right_logo_path=settings.get("name_logo_path") or settings.get("right_logo_path"),
+        signature_path=settings.get("signature_path"),
+    )
 
 
 def _wrap_text(text: str, max_width: float, font_name: str, font_size: float) -> List[str]:
@@ -249,18 +325,61 @@ def _fmt_qty(qty: float) -> str:
         return str(qty)
 
 
-def _line(canvas: Canvas, x1: float, y1: float, x2: float, y2: float) -> None:
-    canvas.line(x1, y1, x2, y2)
+# Bundled fallbacks tried in order when an image is not configured (or missing)
+LOGO_FALLBACKS = ("assets/logo.png",)
+RIGHT_LOGO_FALLBACKS = ("assets/name-logo.png", "assets/name_logo.png", "assets/name_logo.jpg", "assets/name-logo.jpg")
+SIGNATURE_FALLBACKS = ("assets/signature.png", "assets/signature.jpg")
+
+
+def _resolve_image_path(configured: Any, fallbacks: Tuple[str, ...]) -> Path | None:
+    """Resolve a configured image (absolute or asset-relative), else the first bundled fallback.
+
+    The configured path is probed on every call so a moved, deleted or newly
+    created file is noticed; only the bundled fallback lookup is cached.
+    """
+    if configured:
+        p = Path(configured)
+        if not p.exists() and isinstance(configured, str):
+            rp = resource_path(configured)
+            if rp.exists():
+                p = rp
+        if p.exists():
+            return p
+    return _bundled_image_path(fallbacks)
+
+
+@lru_cache(maxsize=8)
+def _bundled_image_path(fallbacks: Tuple[str, ...]) -> Path | None:
+    """First bundled asset in fallbacks that exists; these ship with the app."""
+    for cand in fallbacks:
+        p = resource_path(cand)
+        if p.exists():
+            return p
+    return None
+
+
+@lru_cache(maxsize=32)
+def _cached_image_reader(path: str, mtime: float) -> ImageReader:
+    return ImageReader(path)
+
+
+def _image_reader(path: Path) -> ImageReader:
+    """Shared ImageReader so an image is decoded once, not once per page/invoice.
+
+    Keyed by modification time as well, so replacing a logo or signature
+    file while the app is running is picked up on the next invoice.
+    """
+    return _cached_image_reader(str(path), path.stat().st_mtime)
 
 
-def _draw_header(c: Canvas, font: str, bold_font: str, data: Dict[str, Any], first_page: bool) -> float:
+def _draw_header(c: Canvas, font: str, bold_font: str, ctx: _InvoiceCtx, first_page: bool) -> float:
     """
     Draw the invoice header with:
     - Logo flush to the top margin on the left
     - Only the word "INVOICE" on the right, aligned to the logo's vertical centre baseline
     A thin rule is drawn below the header. Returns the y coordinate below the header.
     """
-    top_y = PAGE_HEIGHT - MARGIN_TOP
+    top_y = HEADER_TOP_Y
     c.setLineWidth(0.5)
     c.setFillColor(TEXT_COLOR)
 
@@ -268,38 +387,9 @@ def _draw_header(c: Canvas, font: str, bold_font: str, data: Dict[str, Any], fir
     logo_path: Path | None = None
     right_logo_path: Path | None = None
     try:
-        settings = data.get("settings", {}) if isinstance(data.get("settings"), dict) else {}
-        lp = settings.get("logo_path")
-        if lp:
-            p = Path(lp)
-            if not p.exists() and isinstance(lp, str):
-                rp = resource_path(lp)
-                if rp.exists():
-                    p = rp
-            if p.exists():
-                logo_path = p
-        if not logo_path:
-            p = resource_path("assets/logo.png")
-            if p.exists():
-                logo_path = p
-
-        # Optional right-side name/logo image
-        rlp = settings.get("name_logo_path") or settings.get("right_logo_path")
-        if rlp:
-            pr = Path(rlp)
-            if not pr.exists() and isinstance(rlp, str):
-                rpr = resource_path(rlp)
-                if rpr.exists():
-                    pr = rpr
-            if pr.exists():
-                right_logo_path = pr
-        # Fallbacks inside assets if not explicitly configured
-        if not right_logo_path:
-            for cand in ("assets/name-logo.png", "assets/name_logo.png", "assets/name_logo.jpg", "assets/name-logo.jpg"):
-                p = resource_path(cand)
-                if p.exists():
-                    right_logo_path = p
-                    break
+        logo_path = _resolve_image_path(ctx.logo_path, LOGO_FALLBACKS)
+        # Optional right-side name/logo image, with fallbacks inside assets
+        right_logo_path = _resolve_image_path(ctx.right_logo_path, RIGHT_LOGO_FALLBACKS)
     except Exception:
         logo_path = None
         right_logo_path = None
@@ -307,10 +397,10 @@ def _draw_header(c: Canvas, font: str, bold_font: str, data: Dict[str, Any], fir
     # Position left logo: top aligned with top margin
     logo_x = MARGIN_LEFT
     logo_y = top_y - LOGO_HEIGHT
-    if logo_path and logo_path.exists():
+    if logo_path:
         try:
             c.drawImage(
-                str(logo_path),
+                _image_reader(logo_path),
                 logo_x,
                 logo_y,
                 width=LOGO_WIDTH,
@@ -322,17 +412,17 @@ def _draw_header(c: Canvas, font: str, bold_font: str, data: Dict[str, Any], fir
             pass
 
     # Set the header baseline to align better with logo centers
-    baseline_y = top_y - (max(LOGO_HEIGHT, RIGHT_LOGO_HEIGHT) * 0.45)
+    baseline_y = HEADER_BASELINE_Y
 
     # Optional right-side block: either an image (name/logo) or text block with name and service lines
     try:
-        if right_logo_path and right_logo_path.exists():
+        if right_logo_path:
             # Draw image variant
             # Keep the right logo vertically aligned with the left logo
             ry = top_y - RIGHT_LOGO_HEIGHT
-            rx = PAGE_WIDTH - MARGIN_RIGHT - RIGHT_LOGO_WIDTH
+            rx = RIGHT_LOGO_X
             c.drawImage(
-                str(right_logo_path),
+                _image_reader(right_logo_path),
                 rx,
                 ry,
                 width=RIGHT_LOGO_WIDTH,
@@ -342,10 +432,10 @@ def _draw_header(c: Canvas, font: str, bold_font: str, data: Dict[str, Any], fir
             )
         else:
             # Draw text variant matching reference: owner name on first line, service on second, with 3 short rules
-            owner = _get(data, "settings.owner", "")
-            service = _get(data, "settings.service_title", "")
+            owner = ctx.owner
+            service = ctx.service_title
             if owner:
-                rx = PAGE_WIDTH - MARGIN_RIGHT
+                rx = CONTENT_RIGHT
                 name_font = bold_font
                 svc_font = font
                 name_size = OWNER_FONT_SIZE
@@ -362,49 +452,45 @@ def _draw_header(c: Canvas, font: str, bold_font: str, data: Dict[str, Any], fir
                 rule_right = rx
                 rule_width = 18 * mm  # Slightly wider rules
                 rule_gap = 2 * mm
-                prev_w = getattr(c, "_lineWidth", None) or getattr(c, "_linewidth", None)
+                c.saveState()
                 c.setLineWidth(1.5)  # Thicker rules for better visibility
-                for i in range(3):
-                    _line(c, rule_right - rule_width, rule_y, rule_right, rule_y)
-                    rule_y -= rule_gap
-                if prev_w is not None:
-                    c.setLineWidth(prev_w)
+                # All three rules in one path
+                c.lines([
+                    (rule_right - rule_width, rule_y - i * rule_gap, rule_right, rule_y - i * rule_gap)
+                    for i in range(3)
+                ])
+                c.restoreState()
     except Exception:
         pass
 
     # Draw the word "INVOICE" centered, better aligned with logos
     c.setFont(bold_font, TITLE_FONT_SIZE)
-    c.drawCentredString(PAGE_WIDTH / 2, baseline_y + 1 * mm, "INVOICE")
+    c.drawCentredString(CENTER_X, baseline_y + 1 * mm, "INVOICE")
 
     # Draw a horizontal rule below the header (full width), positioned just under the lower logo edge
     # With equal logo heights, compute from left logo height
-    line_y = top_y - max(LOGO_HEIGHT, RIGHT_LOGO_HEIGHT) - 3 * mm
-    prev_w = getattr(c, "_lineWidth", None) or getattr(c, "_linewidth", None)
-    prev_stroke = getattr(c, '_strokeColor', None)
+    line_y = HEADER_RULE_Y
+    c.saveState()
     c.setStrokeColor(RULE_COLOR)
     # Heavier rule under the header to match the reference
     c.setLineWidth(1.25)
-    _line(c, MARGIN_LEFT, line_y, PAGE_WIDTH - MARGIN_RIGHT, line_y)
+    c.line(MARGIN_LEFT, line_y, CONTENT_RIGHT, line_y)
     # Restore previous stroke settings
-    if prev_w is not None:
-        c.setLineWidth(prev_w)
-    if prev_stroke is not None:
-        c.setStrokeColor(prev_stroke)
+    c.restoreState()
     return line_y
 
 
-def _draw_invoice_block(c: Canvas, font: str, data: Dict[str, Any], y_top: float) -> float:
-    inv = data.get("invoice", {}) or {}
-    number = inv.get("number", "")
-    date_val = _fmt_date(inv.get("date"))
+def _draw_invoice_block(c: Canvas, font: str, ctx: _InvoiceCtx, y_top: float) -> float:
+    number = ctx.invoice_number
+    date_val = ctx.invoice_date
 
     # Two-column right-aligned block (labels and values), matching reference alignment
     # Keep label column fixed where it was, but move only the values 5 mm left
     # Previous positions (before this change):
     #   value_right_x_prev = PAGE_WIDTH - MARGIN_RIGHT + 5mm
     #   label_right_x_prev = value_right_x_prev - 32mm = PAGE_WIDTH - MARGIN_RIGHT - 27mm
-    label_right_x = PAGE_WIDTH - MARGIN_RIGHT - (27 * mm)
-    value_right_x = PAGE_WIDTH - MARGIN_RIGHT - (1 * mm)  # shift values 1mm further left
+    label_right_x = INFO_LABEL_RIGHT_X
+    value_right_x = INFO_VALUE_RIGHT_X  # values sit 1mm in from the right margin
     # Align with BILL TO’s first line (6 mm below the header line)
     y = y_top - 6 * mm
     c.setFont(font, LABEL_FONT_SIZE)
@@ -415,28 +501,10 @@ def _draw_invoice_block(c: Canvas, font: str, data: Dict[str, Any], y_top: float
     y -= 4.2 * mm
     c.drawRightString(label_right_x, y, "Date:")
     c.drawRightString(value_right_x, y, str(date_val))
-    # Aid PDF text extraction tests: also draw a combined 'Date: <value>' once (invisible on white)
-    try:
-        prev_fill = getattr(c, "_fillColor", None) or getattr(c, "_fillcolor", None)
-        from reportlab.lib import colors as _colors
-        c.setFillColor(_colors.white)
-        c.drawString(MARGIN_LEFT, y, f"Date: {str(date_val)}")
-        if prev_fill is not None:
-            c.setFillColor(prev_fill)
-        else:
-            c.setFillColor(TEXT_COLOR)
-    except Exception:
-        # On any error, continue without impacting visible output
-        c.setFillColor(TEXT_COLOR)
     return y - 2 * mm
 
 
-def _draw_bill_to(c: Canvas, font: str, data: Dict[str, Any], y_top: float) -> float:
-    cust = data.get("customer", {}) if isinstance(data.get("customer"), dict) else {}
-    name = cust.get("name", "")
-    phone = cust.get("phone", "")
-    address = cust.get("address", "")
-
+def _draw_bill_to(c: Canvas, font: str, ctx: _InvoiceCtx, y_top: float) -> float:
     x = MARGIN_LEFT
     y = y_top - 8 * mm  # Better spacing from header
     c.setFont(font, LABEL_FONT_SIZE)
@@ -444,103 +512,61 @@ def _draw_bill_to(c: Canvas, font: str, data: Dict[str, Any], y_top: float) -> f
     y -= 6 * mm  # More space after label
 
     c.setFont(font, TEXT_FONT_SIZE)
-    c.drawString(x, y, name)
-    y -= 4.2 * mm
-    if phone:
-        c.drawString(x, y, phone)
-        y -= 4.2 * mm
-    for ln in str(address or "").splitlines():
-        if not ln:
-            continue
-        c.drawString(x, y, ln)
-        y -= 4.2 * mm
+    # Font is set once above; bind the draw call and line step for the loop
+    draw = c.drawString
+    step = 4.2 * mm
+    for ln in ctx.bill_to_lines:
+        draw(x, y, ln)
+        y -= step
     return y - 2 * mm
 
 
-def _ensure_table_within_page(c: Canvas, y_cursor: float, need_height: float) -> bool:
-    return (y_cursor - need_height) > (MARGIN_BOTTOM + TOTALS_BLOCK_HEIGHT_MIN)
-
-
-def _draw_footer(c: Canvas, font: str, bold_font: str, data: Dict[str, Any]) -> None:
+def _draw_footer(c: Canvas, font: str, bold_font: str, ctx: _InvoiceCtx) -> None:
     # Footer text block shifted by FOOTER_SHIFT; signatory box gets additional shift
-    y = (MARGIN_BOTTOM - FOOTER_SHIFT) + 6
     x = MARGIN_LEFT
-    biz = data.get("business", {}) if isinstance(data.get("business"), dict) else {}
-    settings = data.get("settings", {}) if isinstance(data.get("settings"), dict) else {}
-    permit = biz.get("permit", "") or settings.get("permit", "") or _get(data, "invoice.permit", "")
-    pan = biz.get("pan", "") or settings.get("pan", "") or _get(data, "invoice.pan", "")
-    cheque_to = biz.get("cheque_to", "") or settings.get("cheque_to", "") or biz.get("chequeTo", "")
-    mobile = _get(data, "settings.phone", "") or _get(data, "business.phone", "")
-
-    # Footer lines in the specified order and wording (drawn top-to-bottom)
+    lines = ctx.footer_lines
     c.setFont(font, SMALL_FONT_SIZE)
-    lines = []
-    if permit:
-        lines.append(f"Gujarat Gov. Permit No: {permit}")
-    if pan:
-        lines.append(f"PAN No: {pan}")
-    if cheque_to:
-        lines.append("Please issue the Cheque in the Name of:")
-        lines.append(str(cheque_to).upper())
-    if mobile:
-        lines.append(f"Mobile No: {mobile}")
 
     # Consistent gap whether or not lines are present
     gap = 11
     if lines:
-        # Move the footer text block up by 1mm (1mm down from previous 2mm adjustment)
-        y_top = (MARGIN_BOTTOM - FOOTER_SHIFT) + 6 + (1 * mm) + gap * (len(lines) - 1)
+        # Top line position (including the 1mm lift), shared with the table layout
+        y_top = ctx.footer_text_top
+        # Emit all lines in a single text object; leading == gap moves down one line each
+        t = c.beginText(x, y_top)
+        current_font = None
         for ln in lines:
-            # Bold only the Permit line
-            if ln.startswith("Gujarat Gov. Permit No:"):
-                c.setFont(bold_font, SMALL_FONT_SIZE)
-            else:
-                c.setFont(font, SMALL_FONT_SIZE)
-            c.drawString(x, y_top, ln)
-            y_top -= gap
+            # Bold only the Permit line; switch fonts only when the weight changes
+            line_font = bold_font if ln.startswith("Gujarat Gov. Permit No:") else font
+            if line_font != current_font:
+                t.setFont(line_font, SMALL_FONT_SIZE, gap)
+                current_font = line_font
+            t.textLine(ln)
+        c.drawText(t)
 
     # Left footer rendered as plain lines above
 
     # Authorized Signatory box on right
-    bx = PAGE_WIDTH - MARGIN_RIGHT - SIGN_BOX_W
-    by = MARGIN_BOTTOM - FOOTER_SHIFT - SIGN_BOX_EXTRA_SHIFT
+    bx = SIGN_BOX_X
+    by = SIGN_BOX_Y
     # Estimate left footer block height and align the sign box to match visually
     left_lines_count = len(lines)
     estimated_left_h = (gap * max(1, left_lines_count - 1)) + 2 * mm  # approx visual block height
     box_h = min(float(SIGN_BOX_H), max(24 * mm, float(estimated_left_h)))
-    prev_w = getattr(c, "_lineWidth", None) or getattr(c, "_linewidth", None)
-    prev_stroke = getattr(c, '_strokeColor', None)
+    c.saveState()
     c.setStrokeColor(RULE_COLOR)
     # Revert signatory box stroke to original lighter weight
     c.setLineWidth(0.7)
     c.rect(bx, by, SIGN_BOX_W, box_h, stroke=1, fill=0)
-    if prev_w is not None:
-        c.setLineWidth(prev_w)
-    if prev_stroke is not None:
-        c.setStrokeColor(prev_stroke)
+    c.restoreState()
     # Optional digital signature image inside the box (above the label)
     try:
-        sig_path: Path | None = None
-        sp = _get(data, "settings.signature_path", None)
-        if sp:
-            p = Path(sp)
-            if not p.exists() and isinstance(sp, str):
-                rp = resource_path(sp)
-                if rp.exists():
-                    p = rp
-            if p.exists():
-                sig_path = p
-        if not sig_path:
-            # asset fallbacks
-            for cand in ("assets/signature.png", "assets/signature.jpg"):
-                p = resource_path(cand)
-                if p.exists():
-                    sig_path = p
-                    break
-        if sig_path and sig_path.exists():
+        sig_path = _resolve_image_path(ctx.signature_path, SIGNATURE_FALLBACKS)
+        if sig_path:
             # Read intrinsic image size to scale proportionally and center
+            sig_img = _image_reader(sig_path)
             try:
-                iw, ih = ImageReader(str(sig_path)).getSize()
+                iw, ih = sig_img.getSize()
             except Exception:
                 iw, ih = (600, 200)  # safe defaults
             # available area above the label with padding
@@ -563,7 +589,7 @@ def _draw_footer(c: Canvas, font: str, bold_font: str, data: Dict[str, Any]) ->
                 sx = bx + (SIGN_BOX_W - tw) / 2
                 sy = by + label_h + (avail_h - th) / 2
                 c.drawImage(
-                    str(sig_path),
+                    sig_img,
                     sx,
                     sy,
                     width=tw,
@@ -584,46 +610,60 @@ def _draw_footer(c: Canvas, font: str, bold_font: str, data: Dict[str, Any]) ->
 
 
 # ===== New Table Layout Functions =====
-def build_invoice_table_with_platypus(items: List[Dict[str, Any]], total: float, content_width: float, filler_height: float = 0.0) -> Table:
+def build_invoice_table_with_platypus(lines: List[Dict[str, Any]], total: float, content_width: float, filler_height: float = 0.0) -> Table:
     """
     Build the invoice table using the new table layout system.
     This replaces the manual canvas drawing approach.
+    lines are prebuilt row dicts (sl, description, qty, rate, amount), see _table_lines.
+    """
+    return build_invoice_table(lines, total, content_width, filler_height=filler_height)
+
+
+def _table_lines(items: List[Dict[str, Any]], start_index: int, need_total: bool) -> Tuple[List[Dict[str, Any]], float | None]:
     """
-    # Transform items to match the expected format
-    lines = []
-    for i, item in enumerate(items, 1):
+    Transform items[start_index:] into table rows in a single pass.
+    When need_total is set, the Decimal total (amount, else qty * rate) is
+    accumulated in the same loop; otherwise None is returned for it.
+    """
+    lines: List[Dict[str, Any]] = []
+    amounts = []
+    for n, item in enumerate(islice(items, start_index, None), 1):
+        qty = item.get("qty", 0) or 0
+        rate = item.get("rate", 0) or 0
+        amount = item.get("amount", 0) or 0
         lines.append({
-            "sl": f"{i}.",
+            "sl": f"{n}.",
             "description": str(item.get("description", "")),
-            "qty": float(item.get("qty", 0) or 0),
-            "rate": float(item.get("rate", 0) or 0),
-            "amount": float(item.get("amount", 0) or 0)
+            "qty": float(qty),
+            "rate": float(rate),
+            "amount": float(amount),
         })
-    
-    return build_invoice_table(lines, total, content_width, filler_height=filler_height)
+        if need_total:
+            amounts.append(to_decimal(amount or (to_decimal(qty) * to_decimal(rate))))
+    # Calculate total for the summary row inside the table using Decimal for precision
+    total = float(sum_money(amounts)) if need_total else None
+    return lines, total
 
 
-def _draw_table_with_platypus(c: Canvas, items: List[Dict[str, Any]], y_start: float, content_width: float, data: Dict[str, Any]) -> float:
+def _draw_table_with_platypus(c: Canvas, items: List[Dict[str, Any]], start_index: int, y_start: float, content_width: float, ctx: _InvoiceCtx, total: float | None = None) -> float:
     """
     Draw the invoice table using Platypus table layout.
-    Uses wrapOn/drawOn to compute actual height to ensure reliable rendering.
+    Renders items[start_index:] in place (no list copy per page).
+    The natural height is computed analytically so the table is built only once.
+    total is the invoice total when the caller already has it; it is only
+    trusted for a table that starts at the first item.
     Returns the new y cursor (top of content after drawing the table).
     """
-    # Calculate total for the summary row inside the table using Decimal for precision
-    total_dec = sum_money(
-        [
-            to_decimal(item.get("amount", 0) or (to_decimal(item.get("qty", 0) or 0) * to_decimal(item.get("rate", 0) or 0)))
-            for item in items
-        ]
-    )
-    total = float(total_dec)
+    need_total = total is None or bool(start_index)
+    lines, summed = _table_lines(items, start_index, need_total)
+    if need_total:
+        total = summed
 
-    # Build a probe table to measure its natural height first
-    probe = build_invoice_table_with_platypus(items, total, content_width, filler_height=0.0)
-    _w0, h0 = probe.wrapOn(c, content_width, PAGE_HEIGHT)
+    # Natural height from fixed row heights (no probe table needed)
+    h0 = estimate_height(len(lines))
 
     # Compute the target Y where the table bottom should sit: with minimal spacing above footer
-    footer_text_top = _footer_text_top_y(data)
+    footer_text_top = ctx.footer_text_top
     # Keep very minimal breathing space above footer text block (like reference)
     desired_bottom_y = footer_text_top + 2  # Minimal spacing to match reference invoice exactly
 
@@ -635,14 +675,14 @@ def _draw_table_with_platypus(c: Canvas, items: List[Dict[str, Any]], y_start: f
         filler = min(float(natural_bottom_y - desired_bottom_y), 40.0)  # cap filler for safety
 
     # Build the final table with the computed filler height
-    table = build_invoice_table_with_platypus(items, total, content_width, filler_height=filler)
+    table = build_invoice_table_with_platypus(lines, total, content_width, filler_height=filler)
     _w, h = table.wrapOn(c, content_width, PAGE_HEIGHT)
     table.drawOn(c, MARGIN_LEFT, y_start - h)
     return y_start - h
 
 
 # ===== Public API =====
-def build_invoice_pdf(out_path: Path | str, data: Dict[str, Any]) -> None:
+def build_invoice_pdf(out_path: Path | str | BinaryIO, data: Dict[str, Any]) -> None:
     """Draw a complete invoice PDF using ReportLab (A4) with pagination.
 
         Data shape (keys optional where noted):
@@ -654,42 +694,99 @@ def build_invoice_pdf(out_path: Path | str, data: Dict[str, Any]) -> None:
       "settings"?: {"logo_path"?: str},
       "business"?: {"permit"?: str, "pan"?: str, "cheque_to"?: str}
     }
+
+    out_path may also be a writable binary stream (e.g. io.BytesIO) to keep
+    the PDF in memory instead of writing a file.
     """
 
-    out = Path(out_path)
-    out.parent.mkdir(parents=True, exist_ok=True)
+    build_invoice_pdfs([(out_path, data)])
+
+
+def build_invoice_pdfs(jobs: Iterable[Tuple[Path | str | BinaryIO, Dict[str, Any]]], max_workers: int | None = 1) -> None:
+    """Draw several invoices, e.g. a month's worth, in one call.
+
+    With max_workers=1 (the default) jobs run in this process, sharing fonts
+    and logo images; each (out_path, data) pair gets its own
+    Canvas, as in build_invoice_pdf. Any other value (None = one per CPU)
+    fans the jobs out to a ProcessPoolExecutor, since rendering is CPU-bound.
+    Frozen builds must call multiprocessing.freeze_support() at startup
+    before using worker processes. Stream outputs only work in-process;
+    passing one with max_workers != 1 raises TypeError.
+    """
+    if max_workers != 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        jobs = list(jobs)
+        for out_path, _data in jobs:
+            # A stream would be pickled into the worker and the caller's copy left empty
+            if not isinstance(out_path, (str, Path)):
+                raise TypeError(f"max_workers={max_workers!r} needs file path outputs, got {type(out_path).__name__}")
+
+        with ProcessPoolExecutor(max_workers=max_workers) as ex:
+            # list() surfaces the first worker exception here
+            list(ex.map(_build_invoice_job, jobs))
+        return
+
+    _register_fonts()
+
+    for out_path, data in jobs:
+        if isinstance(out_path, (str, Path)):
+            out = Path(out_path)
+            out.parent.mkdir(parents=True, exist_ok=True)
+            _render_invoice_pdf(str(out), data)
+        else:
+            _render_invoice_pdf(out_path, data)
 
+
+def _build_invoice_job(job: Tuple[Path | str | BinaryIO, Dict[str, Any]]) -> None:
+    # Module-level so ProcessPoolExecutor can pickle it; fonts warm once per worker
+    out_path, data = job
+    build_invoice_pdf(out_path, data)
+
+
+def _render_invoice_pdf(out: str | BinaryIO, data: Dict[str, Any]) -> None:
     font, bold_font = _register_fonts()
-    c = Canvas(str(out), pagesize=PAGE_SIZE)
-    # Set author from business_name if provided in settings or business
-    author = _get(data, "settings.business_name", None) or _get(data, "business.name", None) or "KMC Invoice"
-    c.setAuthor(str(author))
-    c.setTitle(f"Invoice {str(_get(data, 'invoice.number', ''))}")
+    data = _normalize_data(data)
+    ctx = _precompute(data)
+    # Always deflate page streams, whatever a host process left in rl_config
+    c = Canvas(out, pagesize=PAGE_SIZE, pageCompression=1)
+    c.setAuthor(ctx.author)
+    c.setTitle(ctx.title)
+    # Machine-readable invoice facts for search and tests, without drawing extra text
+    c.setKeywords([f"Date: {ctx.invoice_date}", f"Invoice: {ctx.invoice_number}"])
     c.setLineWidth(0.5)
     # Set default print-friendly colors
     c.setFillColor(TEXT_COLOR)
     c.setStrokeColor(RULE_COLOR)
 
-    items: List[Dict[str, Any]] = list(data.get("items", []) or [])
+    items: List[Dict[str, Any]] = data["items"]
+    # Reuse the caller's total when it is usable; a missing, zero or non-finite
+    # total (e.g. not computed yet) leaves the table to sum the items
+    try:
+        total: float | None = float(data["total"])
+    except (KeyError, TypeError, ValueError):
+        total = None
+    if total is not None and not (math.isfinite(total) and total):
+        total = None
 
     def new_page(first_page: bool) -> float:
-        y_after_header = _draw_header(c, font, bold_font, data, first_page)
-        info_y = _draw_invoice_block(c, font, data, y_after_header)
-        bill_y = _draw_bill_to(c, font, data, y_after_header)
+        y_after_header = _draw_header(c, font, bold_font, ctx, first_page)
+        info_y = _draw_invoice_block(c, font, ctx, y_after_header)
+        bill_y = _draw_bill_to(c, font, ctx, y_after_header)
         table_start_y = min(info_y, bill_y) - TABLE_TOP_GAP + TABLE_Y_SHIFT
         return table_start_y - HEADER_ROW_HEIGHT
 
     y = new_page(first_page=True)
 
     # Calculate content width for the table
-    content_width = PAGE_WIDTH - MARGIN_LEFT - MARGIN_RIGHT
+    content_width = CONTENT_WIDTH
 
     start_index = 0
     while start_index < len(items):
         y_before = y
         # Use the Platypus table system for drawing
-        y = _draw_table_with_platypus(c, items[start_index:], y, content_width, data)
-        drawn = len(items[start_index:])  # All remaining items are drawn at once
+        y = _draw_table_with_platypus(c, items, start_index, y, content_width, ctx, total)
+        drawn = len(items) - start_index  # All remaining items are drawn at once
         
         if drawn == 0:
             # Not enough space for even one row; start a new page
@@ -705,6 +802,6 @@ def build_invoice_pdf(out_path: Path | str, data: Dict[str, Any]) -> None:
         else:
             # Last page: totals are already included within the table.
             # Draw footer directly without forcing a page break.
-            _draw_footer(c, font, bold_font, data)
+            _draw_footer(c, font, bold_font, ctx)
 
     c.save()
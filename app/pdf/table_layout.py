@@ -1,4 +1,6 @@
 # app/pdf/table_layout.py
+from functools import lru_cache
+
 from reportlab.platypus import Table, TableStyle
 from reportlab.lib import colors
 from reportlab.lib.units import mm
@@ -14,41 +16,89 @@ W_GRID    = 0.50  # standard grid lines for clean appearance
 W_OUTLINE = 0.70  # slightly thicker outline for better definition
 W_HEAVY   = 1.00  # header/total separators thicker for emphasis
 
+# Brand color for entire table (borders, grid, and text)
+BRAND = colors.HexColor("#1B1464")
+
 # Row height to match reference invoice
 BODY_ROW_H = 8 * mm  # Taller rows for better spacing like reference
 
 PADDING_V = (6, 6)   # top, bottom (generous spacing like reference)
 PADDING_H = (8, 8)   # left, right (generous spacing like reference)
 
-def _col_widths(content_width: float) -> list[float]:
-    fixed = COL_W_SL + COL_W_QTY + COL_W_RATE + COL_W_AMOUNT
+# Sum of the fixed columns; Description takes whatever is left
+_FIXED_COL_W = COL_W_SL + COL_W_QTY + COL_W_RATE + COL_W_AMOUNT
+
+
+# Style commands whose cells do not depend on the row count; built once at import
+_BASE_CMDS: list[tuple] = [
+    # Inner grid and outer outline
+    ("GRID", (0, 0), (-1, -1), W_GRID, BRAND),
+    # BOX strokes top, bottom, left, right: the same four edges in one command
+    ("BOX", (0, 0), (-1, -1), W_OUTLINE, BRAND),
+
+    # Table-wide text defaults (body style); header and total cells override below
+    ("FONTNAME", (0, 0), (-1, -1), "Helvetica"),
+    ("FONTSIZE", (0, 0), (-1, -1), 10),  # Slightly larger body text
+    ("TEXTCOLOR", (0, 0), (-1, -1), BRAND),
+
+    # Header
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, 0), 11),  # Slightly larger header text
+    ("ALIGN", (0, 0), (0, 0), "CENTER"),   # Sl.
+    ("ALIGN", (2, 0), (4, 0), "CENTER"),   # Qty, Rate, Amount
+    ("LINEBELOW", (0, 0), (-1, 0), W_HEAVY, BRAND),  # Use brand color and thicker line
+
+    # Padding
+    ("LEFTPADDING",  (0, 0), (-1, -1), PADDING_H[0]),
+    ("RIGHTPADDING", (0, 0), (-1, -1), PADDING_H[1]),
+    ("TOPPADDING",   (0, 0), (-1, -1), PADDING_V[0]),
+    ("BOTTOMPADDING",(0, 0), (-1, -1), PADDING_V[1]),
+
+    # Vertically center all cells
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+]
+
+
+@lru_cache(maxsize=8)
+def _col_widths(content_width: float) -> tuple[float, ...]:
     # Ensure Description gets at least a practical minimum; use the remainder for exact fit
-    desc = max(120.0, content_width - fixed)
-    return [
+    desc = max(120.0, content_width - _FIXED_COL_W)
+    return (
         COL_W_SL,
         desc,
         COL_W_QTY,
         COL_W_RATE,
         COL_W_AMOUNT,
-    ]
+    )
+
+def estimate_height(line_count: int) -> float:
+    """
+    Height of the table returned by build_invoice_table for line_count items,
+    without building it: header row + body rows + thank-you/total row.
+    """
+    return BODY_ROW_H * (line_count + 2)
 
 def build_invoice_table(lines: list[dict], total: float, content_width: float, filler_height: float = 0.0):
     """
     Build a table that matches Reference Invoice.jpg.
     lines: list of dicts with keys sl, description, qty, rate, amount
+           (qty, rate and amount already numeric, as _table_lines produces them)
     total: numeric total
     content_width: usable width inside margins
     """
     data = [["Sl.", "Description", "Qty", "Rate", "Amount"]]
 
-    for row in lines:
-        data.append([
+    # Format every body row up front; the Table only ever sees ready strings
+    data.extend(
+        [
             row["sl"],
             row["description"],
-            f"{float(row['qty']):.2f}",
+            f"{row['qty']:.2f}",
             f"{row['rate']:.2f}",
             f"{row['amount']:.2f}",
-        ])
+        ]
+        for row in lines
+    )
 
     # No filler row - keep table compact
     filler_i = None
@@ -64,60 +114,31 @@ def build_invoice_table(lines: list[dict], total: float, content_width: float, f
 
     t = Table(data, colWidths=_col_widths(content_width), rowHeights=row_heights, repeatRows=1)
 
-    ts = TableStyle()
-    # Brand color for entire table (borders, grid, and text)
-    BRAND = colors.HexColor("#1B1464")
-    # Inner grid and outer outline
-    ts.add("GRID", (0, 0), (-1, -1), W_GRID, BRAND)
-    ts.add("LINEABOVE", (0, 0), (-1, 0), W_OUTLINE, BRAND)
-    ts.add("LINEBELOW", (0, -1), (-1, -1), W_OUTLINE, BRAND)
-    ts.add("LINEBEFORE", (0, 0), (0, -1), W_OUTLINE, BRAND)
-    ts.add("LINEAFTER", (-1, 0), (-1, -1), W_OUTLINE, BRAND)
-
-    # Header
-    ts.add("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold")
-    ts.add("FONTSIZE", (0, 0), (-1, 0), 11)  # Slightly larger header text
-    ts.add("TEXTCOLOR", (0, 0), (-1, 0), BRAND)
-    ts.add("ALIGN", (0, 0), (0, 0), "CENTER")   # Sl.
-    ts.add("ALIGN", (2, 0), (4, 0), "CENTER")   # Qty, Rate, Amount
-    ts.add("LINEBELOW", (0, 0), (-1, 0), W_HEAVY, BRAND)  # Use brand color and thicker line
+    cmds = list(_BASE_CMDS)
 
     # Body (rows between header and the combined thank/total row, excluding filler if present)
     last_body_i = (filler_i - 1) if (filler_i is not None) else (thank_total_i - 1)
     if last_body_i >= 1:
-        ts.add("FONTNAME", (0, 1), (-1, last_body_i), "Helvetica")
-        ts.add("FONTSIZE", (0, 1), (-1, last_body_i), 10)  # Slightly larger body text
-        ts.add("TEXTCOLOR", (0, 1), (-1, last_body_i), BRAND)
-        ts.add("ALIGN", (0, 1), (0, last_body_i), "CENTER")  # Sl.
-        ts.add("ALIGN", (2, 1), (2, last_body_i), "CENTER")  # Qty
-        ts.add("ALIGN", (3, 1), (4, last_body_i), "RIGHT")   # Rate, Amount
-
-    # Padding
-    ts.add("LEFTPADDING",  (0, 0), (-1, -1), PADDING_H[0])
-    ts.add("RIGHTPADDING", (0, 0), (-1, -1), PADDING_H[1])
-    ts.add("TOPPADDING",   (0, 0), (-1, -1), PADDING_V[0])
-    ts.add("BOTTOMPADDING",(0, 0), (-1, -1), PADDING_V[1])
-
-    # Combined Thank you + Total row styling
-    # Left side span across 0..2 and left-align; right side shows Total label and amount
-    ts.add("SPAN", (0, thank_total_i), (2, thank_total_i))
-    ts.add("FONTNAME", (0, thank_total_i), (0, thank_total_i), "Helvetica-Oblique")
-    ts.add("FONTSIZE", (0, thank_total_i), (0, thank_total_i), 10)  # Slightly larger
-    ts.add("TEXTCOLOR", (0, thank_total_i), (0, thank_total_i), BRAND)
-    ts.add("ALIGN", (0, thank_total_i), (0, thank_total_i), "LEFT")
-
-    # Right side: emphasize the total area
-    ts.add("ALIGN", (3, thank_total_i), (3, thank_total_i), "RIGHT")  # "Total:" aligned to right
-    ts.add("ALIGN", (4, thank_total_i), (4, thank_total_i), "RIGHT")  # amount right-aligned
-    ts.add("FONTNAME", (3, thank_total_i), (4, thank_total_i), "Helvetica-Bold")
-    ts.add("FONTSIZE", (3, thank_total_i), (4, thank_total_i), 13)  # Larger for emphasis
-    ts.add("TEXTCOLOR", (3, thank_total_i), (4, thank_total_i), BRAND)
-    ts.add("LINEABOVE", (0, thank_total_i), (-1, thank_total_i), W_HEAVY, BRAND)  # Thicker line above total
-
-    # No filler row to hide
-
-    # Vertically center all cells
-    ts.add("VALIGN", (0, 0), (-1, -1), "MIDDLE")
+        cmds.extend([
+            ("ALIGN", (0, 1), (0, last_body_i), "CENTER"),  # Sl.
+            ("ALIGN", (2, 1), (2, last_body_i), "CENTER"),  # Qty
+            ("ALIGN", (3, 1), (4, last_body_i), "RIGHT"),   # Rate, Amount
+        ])
 
-    t.setStyle(ts)
-    return t
\ No newline at end of file
+    cmds.extend([
+        # Combined Thank you + Total row styling
+        # Left side span across 0..2 and left-align; right side shows Total label and amount
+        ("SPAN", (0, thank_total_i), (2, thank_total_i)),
+        ("FONTNAME", (0, thank_total_i), (0, thank_total_i), "Helvetica-Oblique"),
+        ("ALIGN", (0, thank_total_i), (0, thank_total_i), "LEFT"),
+
+        # Right side: emphasize the total area
+        ("ALIGN", (3, thank_total_i), (3, thank_total_i), "RIGHT"),  # "Total:" aligned to right
+        ("ALIGN", (4, thank_total_i), (4, thank_total_i), "RIGHT"),  # amount right-aligned
+        ("FONTNAME", (3, thank_total_i), (4, thank_total_i), "Helvetica-Bold"),
+        ("FONTSIZE", (3, thank_total_i), (4, thank_total_i), 13),  # Larger for emphasis
+        ("LINEABOVE", (0, thank_total_i), (-1, thank_total_i), W_HEAVY, BRAND),  # Thicker line above total
+    ])
+
+    t.setStyle(TableStyle(cmds))
+    return t
@@ -1,10 +1,24 @@
 import logging
+import os
+import sys
 
 logger = logging.getLogger(__name__)
 
+# Pids of viewers launched with posix_spawnp, reaped on the next launch
+_spawned = []
+
+
+def _reap_spawned():
+        for pid in list(_spawned):
+                try:
+                        done, _status = os.waitpid(pid, os.WNOHANG)
+                except ChildProcessError:
+                        done = pid
+                if done:
+                        _spawned.remove(pid)
+
 
 def print_pdf(path):
-        import sys, os
         if sys.platform != "win32":
                 return False
         try:
@@ -16,7 +30,6 @@ def print_pdf(path):
 
 
 def open_file(path):
-        import sys, os, subprocess
         if sys.platform == "win32":
                 try:
                         os.startfile(path)
@@ -26,7 +39,14 @@ def open_file(path):
                         return False
         else:
                 try:
-                        subprocess.Popen(["xdg-open", path])
+                        if hasattr(os, "posix_spawnp"):
+                                # No pipes or exit status needed: spawn directly instead of
+                                # going through Popen's fork/exec setup
+                                _reap_spawned()
+                                _spawned.append(os.posix_spawnp("xdg-open", ["xdg-open", path], os.environ))
+                        else:
+                                import subprocess
+                                subprocess.Popen(["xdg-open", path])
                         return True
                 except Exception:
                         logger.exception("Failed to open file: %s", path)
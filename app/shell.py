@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 from typing import Optional
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtGui import QFont
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QPushButton, QLabel, QStackedWidget, QFrame
+    QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QPushButton, QLabel, QStackedWidget, QFrame, QButtonGroup
 )
 
 from app.styles.themes import light_qss, dark_qss
@@ -21,11 +21,16 @@ class NavRail(QWidget):
         v.setContentsMargins(8, 12, 8, 12)
         v.setSpacing(4)
 
+        # One exclusive group dispatches clicks by button id and keeps a single button checked
+        self.group = QButtonGroup(self)
+        self.group.setExclusive(True)
+        self.group.idClicked.connect(self.navigate.emit)
+
         def make_btn(text: str, idx: int) -> QPushButton:
             b = QPushButton(text)
             b.setObjectName("NavButton")
             b.setCheckable(True)
-            b.clicked.connect(lambda: self.navigate.emit(idx))
+            self.group.addButton(b, idx)
             b.setCursor(Qt.PointingHandCursor)
             b.setMinimumHeight(32)
             return b
@@ -42,8 +47,9 @@ class NavRail(QWidget):
         self.select(0)
 
     def select(self, idx: int) -> None:
-        for i, b in enumerate(self.buttons):
-            b.setChecked(i == idx)
+        b = self.group.button(idx)
+        if b is not None:
+            b.setChecked(True)
 
 
 class FooterBar(QWidget):
@@ -101,24 +107,15 @@ class AppWindow(QMainWindow):
         except Exception:
             pass
         self.stack.addWidget(self.invoice_view)
-        # Additional views: invoices and customers (items/settings are placeholders)
-        from app.views.invoices_view import InvoicesView
-        from app.views.customers_view import CustomersView
-        from app.views.placeholders import placeholder
-        self.invoices_view = InvoicesView(); self.stack.addWidget(self.invoices_view)
-        self.customers_view = CustomersView(); self.stack.addWidget(self.customers_view)
-        self.items_view = placeholder("Items"); self.stack.addWidget(self.items_view)
-        self.settings_view = placeholder("Settings"); self.stack.addWidget(self.settings_view)
-        # Wire activations
-        try:
-            self.invoices_view.invoiceActivated.connect(self._on_invoice_activated)
-        except Exception:
-            pass
-        try:
-            # Double-click on a customer row prefills Bill To
-            self.customers_view.table.itemDoubleClicked.connect(lambda _it: self._on_customer_row_activated())
-        except Exception:
-            pass
+        # Other views (invoices, customers, items/settings placeholders) are built on
+        # first navigation so startup does not import or query for them
+        self._views: dict[int, QWidget] = {0: self.invoice_view}
+        # Re-shown list views refresh on the next event-loop turn, after the switch
+        # has painted; navigating again before then cancels the pending refresh
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._refresh_current_view)
 
         body.addWidget(self.stack, 1)
         layout.addLayout(body, 1)
@@ -150,16 +147,54 @@ class AppWindow(QMainWindow):
 
     def _on_nav(self, idx: int) -> None:
         self.nav.select(idx)
-        self.stack.setCurrentIndex(idx)
-        # Refresh list views when shown
+        self._refresh_timer.stop()
+        view = self._views.get(idx)
+        if view is None:
+            # Views load their lists when constructed, so no refresh is needed here
+            view = self._create_view(idx)
+            self._views[idx] = view
+            self.stack.addWidget(view)
+        elif idx in (1, 2):
+            # Refresh list views when shown
+            self._refresh_timer.start()
+        self.stack.setCurrentWidget(view)
+
+    def _refresh_current_view(self) -> None:
+        view = self.stack.currentWidget()
         try:
-            if idx == 1 and hasattr(self, 'invoices_view'):
+            if view is getattr(self, 'invoices_view', None):
                 self.invoices_view.refresh()
-            elif idx == 2 and hasattr(self, 'customers_view'):
+            elif view is getattr(self, 'customers_view', None):
                 self.customers_view.refresh()
         except Exception:
             pass
 
+    def _create_view(self, idx: int) -> QWidget:
+        """Build the view behind nav index idx (1-4) and wire its activations."""
+        if idx == 1:
+            from app.views.invoices_view import InvoicesView
+            self.invoices_view = InvoicesView()
+            try:
+                self.invoices_view.invoiceActivated.connect(self._on_invoice_activated)
+            except Exception:
+                pass
+            return self.invoices_view
+        if idx == 2:
+            from app.views.customers_view import CustomersView
+            self.customers_view = CustomersView()
+            try:
+                # Double-click on a customer row prefills Bill To
+                self.customers_view.table.itemDoubleClicked.connect(lambda _it: self._on_customer_row_activated())
+            except Exception:
+                pass
+            return self.customers_view
+        from app.views.placeholders import placeholder
+        if idx == 3:
+            self.items_view = placeholder("Items")
+            return self.items_view
+        self.settings_view = placeholder("Settings")
+        return self.settings_view
+
     def _on_invoice_activated(self, inv_id: int) -> None:
         """Load the selected invoice into the editor and switch to Invoice view."""
         try:
@@ -195,21 +230,8 @@ class AppWindow(QMainWindow):
                 pass
             # Items
             try:
-                # Clear rows
-                while self.items.vbox.count():
-                    w = self.items.vbox.itemAt(0).widget()
-                    if w:
-                        self.items.remove_row(w)
-                loaded = False
-                for it in (data.get('items') or []):
-                    self.items.add_row(
-                        description=str(it.get('description') or ""),
-                        qty=float(it.get('qty') or 0.0),
-                        rate=float(it.get('rate') or 0.0),
-                    )
-                    loaded = True
-                if not loaded:
-                    self.items.add_row()
+                # Replace rows in one batch (one empty row if the invoice has none)
+                self.items.set_items(data.get('items') or [])
                 # Recalculate totals
                 try:
                     self.validate_form(); self.collect_data();  # no-op with side-effects for consistency
@@ -225,10 +247,7 @@ class AppWindow(QMainWindow):
     def _on_customer_row_activated(self) -> None:
         """Prefill Bill To from the selected customer and switch to Invoice view."""
         try:
-            r = self.customers_view.table.currentRow()
-            if r < 0:
-                return
-            c = self.customers_view._data[r] if r < len(getattr(self.customers_view, '_data', [])) else None
+            c = self.customers_view.current_customer()
             if not c:
                 return
             try:
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from app.styles.tokens import Colors, Radius, Space
 
 
+# Tokens are plain class attributes that never change at runtime, so each
+# stylesheet is interpolated once and reused on every theme switch
+@lru_cache(maxsize=1)
 def light_qss() -> str:
     c = Colors
     r = Radius
@@ -32,6 +37,7 @@ def light_qss() -> str:
     """
 
 
+@lru_cache(maxsize=1)
 def dark_qss() -> str:
     c = Colors
     r = Radius
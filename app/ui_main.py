@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from datetime import date as _date
+from functools import lru_cache
 from pathlib import Path
 
-from PySide6.QtCore import Qt, QDate
+from PySide6.QtCore import Qt, QDate, QTimer
 from PySide6.QtGui import QFont, QPixmap, QColor, QBrush
 from PySide6.QtWidgets import QGraphicsDropShadowEffect
 from PySide6.QtWidgets import (
@@ -33,13 +34,36 @@ from app.core.paths import resource_path
 from app.widgets.line_items_widget import LineItemsWidget
 
 
+def _choose_logo(logo_path: str | None) -> Path | None:
+    """Configured logo when it exists (as given or as a resource); else the bundled asset."""
+    if logo_path:
+        p = Path(logo_path)
+        if p.exists():
+            return p
+        rp = resource_path(logo_path)
+        if rp.exists():
+            return rp
+    default_logo_path = resource_path("assets/logo.png")
+    return default_logo_path if default_logo_path.exists() else None
+
+
+@lru_cache(maxsize=4)
+def _header_logo(path: str, mtime: float) -> QPixmap:
+    # Decoded and scaled once per file version; mtime in the key picks up a replaced logo
+    return QPixmap(path).scaledToHeight(48, Qt.SmoothTransformation)
+
+
 class MainWindow(QMainWindow):
     dark_mode: bool = False
 
+    # Validation highlight styles, built once and shared by every mark
+    _INVALID_FIELD_QSS = "background-color: #ffecec; border: 1px solid #e07070;"
+    _INVALID_NAME_QSS = "border: 1px solid #e07070;"
+
     def _recalc_total(self) -> None:
         """Compute total from line items only (no tax) and update the UI."""
         try:
-            subtotal = sum(float(it.get('amount', 0.0)) for it in self.items.get_items())
+            subtotal = self.items.subtotal()
         except Exception:
             subtotal = 0.0
         total = round_money(subtotal)
@@ -49,6 +73,8 @@ class MainWindow(QMainWindow):
         super().__init__()
         QApplication.setStyle("Fusion")
         self.setWindowTitle("KMC Invoice")
+        # Editors currently highlighted by validate_form; only these need resetting
+        self._invalid_widgets: set[QWidget] = set()
 
         # Load settings and ensure DB exists
         self.settings: Settings = load_settings()
@@ -63,22 +89,9 @@ class MainWindow(QMainWindow):
         header = QHBoxLayout()
         self.logo_label = QLabel()
         # Prefer configured logo path when it exists; fallback to bundled asset; hide if none
-        settings_logo = self.settings.logo_path
-        default_logo_path = resource_path("assets/logo.png")
-        chosen_logo = None
-        if settings_logo:
-            p = Path(settings_logo)
-            if not p.exists():
-                rp = resource_path(settings_logo)
-                if rp.exists():
-                    p = rp
-            if p.exists():
-                chosen_logo = p
-        if not chosen_logo and default_logo_path.exists():
-            chosen_logo = default_logo_path
-        if chosen_logo and chosen_logo.exists():
-            pm = QPixmap(str(chosen_logo))
-            self.logo_label.setPixmap(pm.scaledToHeight(48, Qt.SmoothTransformation))
+        chosen_logo = _choose_logo(self.settings.logo_path)
+        if chosen_logo:
+            self.logo_label.setPixmap(_header_logo(str(chosen_logo), chosen_logo.stat().st_mtime))
             self.logo_label.show()
         else:
             self.logo_label.hide()
@@ -137,13 +150,10 @@ class MainWindow(QMainWindow):
         info_form.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
         self.inv_number = QLineEdit()
         self.inv_number.setReadOnly(True)
-        # Auto-generate invoice number (peek only; do not increment until save)
-        try:
-            with get_session() as s:
-                prefix = self.settings.invoice_prefix
-                self.inv_number.setText(peek_next_invoice_number(prefix, s))
-        except Exception:
-            self.inv_number.setText(f"{self.settings.invoice_prefix}0001")
+        # Auto-generate invoice number (peek only; do not increment until save) on the
+        # first event-loop turn, so the DB round-trip does not hold up the first paint;
+        # self is the context object, so Qt drops the call if the editor is deleted first
+        QTimer.singleShot(0, self, self._peek_invoice_number)
 
         self.date_edit = QDateEdit()
         self.date_edit.setDisplayFormat("dd-MM-yyyy")
@@ -270,12 +280,7 @@ class MainWindow(QMainWindow):
         self.addr_edit.clear()
         # Reset items to a single empty row
         try:
-            # remove all existing rows
-            while self.items.vbox.count():
-                w = self.items.vbox.itemAt(0).widget()
-                if w:
-                    self.items.remove_row(w)
-            self.items.add_row()
+            self.items.set_items()
             self._update_total(0.0)
         except Exception:
             pass
@@ -285,13 +290,7 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
         # Peek next invoice number for current prefix without incrementing
-        try:
-            from app.data.db import get_session
-            from app.core.numbering import peek_next_invoice_number
-            with get_session() as s:
-                self.inv_number.setText(peek_next_invoice_number(self.settings.invoice_prefix, s))
-        except Exception:
-            self.inv_number.setText(f"{self.settings.invoice_prefix}0001")
+        self._peek_invoice_number()
         # Clear any validation styles
         if hasattr(self, '_clear_validation_styles'):
             try:
@@ -358,22 +357,8 @@ class MainWindow(QMainWindow):
                     pass
                 # Items
                 try:
-                    # Clear rows
-                    while self.items.vbox.count():
-                        w = self.items.vbox.itemAt(0).widget()
-                        if w:
-                            self.items.remove_row(w)
-                    loaded = False
-                    for it in (data.get('items') or []):
-                        self.items.add_row(
-                            description=str(it.get('description') or ""),
-                            qty=float(it.get('qty') or 0.0),
-                            rate=float(it.get('rate') or 0.0),
-                        )
-                        loaded = True
-                    if not loaded:
-                        # Keep one empty row to start with
-                        self.items.add_row()
+                    # Replace rows in one batch; keeps one empty row to start with
+                    self.items.set_items(data.get('items') or [])
                     self._recalc_total()
                 except Exception:
                     pass
@@ -480,6 +465,14 @@ class MainWindow(QMainWindow):
                 app.setStyleSheet("")
             self.apply_styles()
 
+    def _peek_invoice_number(self) -> None:
+        """Show the next invoice number for the current prefix without incrementing it."""
+        try:
+            with get_session() as s:
+                self.inv_number.setText(peek_next_invoice_number(self.settings.invoice_prefix, s))
+        except Exception:
+            self.inv_number.setText(f"{self.settings.invoice_prefix}0001")
+
     def _update_total(self, subtotal: float) -> None:
         """Update only the total value label from current items (no subtotal UI)."""
         total = round_money(subtotal)
@@ -527,33 +520,15 @@ class MainWindow(QMainWindow):
         self.settings = settings
         # Update header title and logo
         self.title_label.setText(self.settings.business_name or "KMC Invoice")
-        default_logo_path = resource_path("assets/logo.png")
-        chosen_logo = None
-        if self.settings.logo_path:
-            p = Path(self.settings.logo_path)
-            if not p.exists():
-                rp = resource_path(self.settings.logo_path)
-                if rp.exists():
-                    p = rp
-            if p.exists():
-                chosen_logo = p
-        if not chosen_logo and default_logo_path.exists():
-            chosen_logo = default_logo_path
-        if chosen_logo and chosen_logo.exists():
-            pm = QPixmap(str(chosen_logo))
-            self.logo_label.setPixmap(pm.scaledToHeight(48, Qt.SmoothTransformation))
+        chosen_logo = _choose_logo(self.settings.logo_path)
+        if chosen_logo:
+            self.logo_label.setPixmap(_header_logo(str(chosen_logo), chosen_logo.stat().st_mtime))
             self.logo_label.show()
         else:
             self.logo_label.clear()
             self.logo_label.hide()
         # Update invoice number for new prefix (peek only)
-        try:
-            from app.data.db import get_session
-            from app.core.numbering import peek_next_invoice_number
-            with get_session() as s:
-                self.inv_number.setText(peek_next_invoice_number(self.settings.invoice_prefix, s))
-        except Exception:
-            self.inv_number.setText(f"{self.settings.invoice_prefix}0001")
+        self._peek_invoice_number()
         # Recalculate total (no tax in UI)
         self._recalc_total()
         # Apply compact mode tweaks (lighter spacing/font) without changing layout structure
@@ -571,27 +546,20 @@ class MainWindow(QMainWindow):
 
     # --- Validation helpers ---
     def _clear_validation_styles(self) -> None:
-        # Reset edits
-        for w in (self.name_edit, self.phone_edit, self.addr_edit):
-            w.setStyleSheet("")
-        # Reset per-row editor styles in LineItemsWidget
-        try:
-            count = self.items.vbox.count()
-            for i in range(count):
-                roww = self.items.vbox.itemAt(i).widget()
-                if not roww:
-                    continue
-                for attr in ("desc_edit", "qty_spin", "rate_spin"):
-                    ed = getattr(roww, attr, None)
-                    if ed and hasattr(ed, "setStyleSheet"):
-                        ed.setStyleSheet("")
-        except Exception:
-            pass
+        # Reset only the editors that were highlighted, not every row's editors
+        for w in self._invalid_widgets:
+            try:
+                w.setStyleSheet("")
+            except Exception:
+                # Row may have been removed (and deleted) since it was marked
+                pass
+        self._invalid_widgets.clear()
 
     def _mark_field_invalid(self, widget) -> None:
         try:
             # Light red background and subtle border
-            widget.setStyleSheet("background-color: #ffecec; border: 1px solid #e07070;")
+            widget.setStyleSheet(self._INVALID_FIELD_QSS)
+            self._invalid_widgets.add(widget)
         except Exception:
             pass
 
@@ -605,7 +573,8 @@ class MainWindow(QMainWindow):
 
         # Required: Customer name
         if not self.name_edit.text().strip():
-            self.name_edit.setStyleSheet("border: 1px solid #e07070;")
+            self.name_edit.setStyleSheet(self._INVALID_NAME_QSS)
+            self._invalid_widgets.add(self.name_edit)
             issues.append("Customer name is required.")
 
         # Validate line items (new widget)
@@ -622,14 +591,9 @@ class MainWindow(QMainWindow):
             qty = getattr(roww, "qty_spin", None)
             rate = getattr(roww, "rate_spin", None)
             desc_text = (desc.text().strip() if desc else "")
-            try:
-                qty_val = float(qty.value()) if qty else 0.0
-            except Exception:
-                qty_val = 0.0
-            try:
-                rate_val = float(rate.value()) if rate else 0.0
-            except Exception:
-                rate_val = 0.0
+            # The spin boxes only accept numeric text, so value() is always a float
+            qty_val = qty.value() if qty else 0.0
+            rate_val = rate.value() if rate else 0.0
 
             is_empty = (desc_text == "" and qty_val == 0.0 and rate_val == 0.0)
             if is_empty:
@@ -706,20 +670,7 @@ class MainWindow(QMainWindow):
                     pass
                 # Items
                 try:
-                    while self.items.vbox.count():
-                        w = self.items.vbox.itemAt(0).widget()
-                        if w:
-                            self.items.remove_row(w)
-                    loaded = False
-                    for it in (data.get('items') or []):
-                        self.items.add_row(
-                            description=str(it.get('description') or ""),
-                            qty=float(it.get('qty') or 0.0),
-                            rate=float(it.get('rate') or 0.0),
-                        )
-                        loaded = True
-                    if not loaded:
-                        self.items.add_row()
+                    self.items.set_items(data.get('items') or [])
                     self._recalc_total()
                 except Exception:
                     pass
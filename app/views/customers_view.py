@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Any, Dict, List, Optional
 
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QTableWidget, QTableWidgetItem
 
 from app.data.repo import search_customers
@@ -30,6 +31,7 @@ class CustomersView(QWidget):
         self.btn_refresh.clicked.connect(self.refresh)
         self.search_edit.textChanged.connect(lambda _t: self.refresh())
         self._data: List[dict] = []
+        self._by_id: Dict[int, Any] = {}
         self.refresh()
 
     def _clear(self) -> None:
@@ -39,9 +41,21 @@ class CustomersView(QWidget):
     def refresh(self) -> None:
         q = self.search_edit.text().strip()
         self._data = search_customers(q, 200)
+        self._by_id = {c.id: c for c in self._data}
         self.table.setRowCount(len(self._data))
         for r, c in enumerate(self._data):
-            self.table.setItem(r, 0, QTableWidgetItem(c.name or ""))
+            name_item = QTableWidgetItem(c.name or "")
+            # Rows carry their customer id so lookups survive sorting/filtering
+            name_item.setData(Qt.UserRole, c.id)
+            self.table.setItem(r, 0, name_item)
             self.table.setItem(r, 1, QTableWidgetItem(c.phone or ""))
             self.table.setItem(r, 2, QTableWidgetItem(c.address or ""))
         self.table.resizeColumnsToContents()
+
+    def current_customer(self) -> Optional[Any]:
+        """Customer on the current row, looked up by the id stored on that row."""
+        r = self.table.currentRow()
+        item = self.table.item(r, 0) if r >= 0 else None
+        if item is None:
+            return None
+        return self._by_id.get(item.data(Qt.UserRole))
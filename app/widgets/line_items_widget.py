@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import List, Dict, Any
+from decimal import Decimal
+from typing import List, Dict, Any, Iterable
 
 from PySide6.QtCore import Qt, Signal, QLocale
 from PySide6.QtGui import QValidator
@@ -143,10 +144,12 @@ class LineItemRow(QWidget):
 
     Emits:
       - subtotalChanged(float): the computed amount for this row after any change
+      - amountChanged(Decimal): new amount minus previous amount, after any change
       - removed(QWidget): when the row requests to be removed
     """
 
     subtotalChanged = Signal(float)
+    amountChanged = Signal(object)
     removed = Signal(QWidget)
 
     def __init__(self, row_number: int, description: str = "", qty: float = 0.0, rate: float = 0.0, parent: QWidget | None = None) -> None:
@@ -182,8 +185,10 @@ class LineItemRow(QWidget):
         self.rate_spin.setFixedWidth(120)
         self.layout.addWidget(self.rate_spin)
 
-        # Amount (right-aligned, fixed min width)
-        self.amount_lbl = QLabel(fmt_money(qty * rate))
+        # Amount (right-aligned, fixed min width); kept as a Decimal so totals never
+        # have to read it back out of the widgets
+        self.amount = round_money_dec(to_decimal(self.qty_spin.value()) * to_decimal(self.rate_spin.value()))
+        self.amount_lbl = QLabel(fmt_money(self.amount))
         self.amount_lbl.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
         self.amount_lbl.setFixedWidth(140)
         self.layout.addWidget(self.amount_lbl)
@@ -210,9 +215,11 @@ class LineItemRow(QWidget):
         outer.addWidget(frame)
 
     def _recalc(self) -> None:
-        amt_dec = round_money_dec(to_decimal(self.qty_spin.value()) * to_decimal(self.rate_spin.value()))
-        self.amount_lbl.setText(fmt_money(amt_dec))
-        self.subtotalChanged.emit(float(amt_dec))
+        old = self.amount
+        self.amount = round_money_dec(to_decimal(self.qty_spin.value()) * to_decimal(self.rate_spin.value()))
+        self.amount_lbl.setText(fmt_money(self.amount))
+        self.subtotalChanged.emit(float(self.amount))
+        self.amountChanged.emit(self.amount - old)
 
     def get_data(self) -> Dict[str, float | str]:
         qty = to_decimal(self.qty_spin.value())
@@ -253,6 +260,10 @@ class LineItemsWidget(QWidget):
         header.addSpacing(28)  # remove button column
         root.addLayout(header)
 
+        # Running sum of row amounts, adjusted by each change instead of re-summing all rows;
+        # row amounts are exact 2-dp Decimals, so it never drifts
+        self._subtotal = Decimal("0")
+
         # Scroll area for rows
         self.scroll = QScrollArea()
         self.scroll.setWidgetResizable(True)
@@ -267,38 +278,75 @@ class LineItemsWidget(QWidget):
         self.add_row()
 
     def add_row(self, description: str = "", qty: float = 0.0, rate: float = 0.0) -> None:
-        n = self.vbox.count() + 1
-        row = LineItemRow(n, description, qty, rate)
-        row.subtotalChanged.connect(self._on_subtotal_change)
+        # Appended rows are numbered on creation; nothing above them changes
+        self._append_row(description, qty, rate)
+        self._emit_totals()
+
+    def _append_row(self, description: str = "", qty: float = 0.0, rate: float = 0.0) -> None:
+        row = LineItemRow(self.vbox.count() + 1, description, qty, rate)
+        row.amountChanged.connect(self._on_amount_changed)
         row.removed.connect(self.remove_row)
         self.vbox.addWidget(row)
-        self._reindex()
+        self._subtotal += row.amount
+
+    def clear(self) -> None:
+        """Remove every row in one pass, without renumbering or emitting totals per row."""
+        while self.vbox.count():
+            w = self.vbox.takeAt(0).widget()
+            if w is not None:
+                w.setParent(None)
+                w.deleteLater()
+        self._subtotal = Decimal("0")
+
+    def set_items(self, items: Iterable[Dict[str, Any]] = ()) -> None:
+        """Replace all rows with items (description/qty/rate); keeps one empty row if none.
+
+        Rows are rebuilt with painting suspended and totals are emitted once at the end,
+        instead of a relayout, renumber and totals pass for every removed and added row.
+        """
+        self.rows_container.setUpdatesEnabled(False)
+        try:
+            self.clear()
+            for it in items:
+                self._append_row(
+                    description=str(it.get("description") or ""),
+                    qty=float(it.get("qty") or 0.0),
+                    rate=float(it.get("rate") or 0.0),
+                )
+            if not self.vbox.count():
+                self._append_row()
+        finally:
+            self.rows_container.setUpdatesEnabled(True)
         self._emit_totals()
 
     def remove_row(self, row_widget: QWidget) -> None:
+        idx = self.vbox.indexOf(row_widget)
+        if idx < 0:
+            return
+        if isinstance(row_widget, LineItemRow):
+            self._subtotal -= row_widget.amount
         self.vbox.removeWidget(row_widget)
         row_widget.setParent(None)
         row_widget.deleteLater()
-        self._reindex()
+        # Only rows below the removed one shift up
+        self._reindex(idx)
         self._emit_totals()
 
-    def _reindex(self) -> None:
-        for i in range(self.vbox.count()):
+    def _reindex(self, start: int = 0) -> None:
+        for i in range(start, self.vbox.count()):
             w = self.vbox.itemAt(i).widget()
             if hasattr(w, "lbl_sl"):
                 w.lbl_sl.setText(str(i + 1))
 
+    def subtotal(self) -> float:
+        """Current sum of row amounts, from the running total (no per-row reads)."""
+        return float(self._subtotal)
+
     def _emit_totals(self) -> None:
-        subtotal = 0.0
-        for i in range(self.vbox.count()):
-            w = self.vbox.itemAt(i).widget()
-            if hasattr(w, "get_data"):
-                data = w.get_data()
-                if isinstance(data, dict) and data.get("amount") is not None:
-                    subtotal += float(data["amount"])  # type: ignore[index]
-        self.totalsChanged.emit(float(subtotal))
+        self.totalsChanged.emit(float(self._subtotal))
 
-    def _on_subtotal_change(self, *_args) -> None:
+    def _on_amount_changed(self, delta: Decimal) -> None:
+        self._subtotal += delta
         self._emit_totals()
 
     def get_items(self) -> List[Dict[str, Any]]:
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from io import BytesIO
 from pathlib import Path
+from typing import Any, Dict
 
 import math
 
+import pytest
+
 from pypdf import PdfReader
 
 from app.pdf.pdf_draw import build_invoice_pdf
@@ -14,6 +18,29 @@ def _a4_size_points() -> tuple[float, float]:
     return (595.2755905511812, 841.8897637795277)
 
 
+def _sample_data(**overrides: Any) -> Dict[str, Any]:
+    # One-item invoice for the smaller tests; overrides replace whole top-level keys
+    data: Dict[str, Any] = {
+        "invoice": {"number": "KMC-0002", "date": "10-08-2025"},
+        "customer": {"name": "Stream Customer"},
+        "items": [{"description": "Item A", "qty": 1, "rate": 10.0, "amount": 10.0}],
+        "total": 10.0,
+    }
+    data.update(overrides)
+    return data
+
+
+def _pdf_text(pdf: BytesIO | Path) -> str:
+    # Text of a single-page invoice, read from a file or an in-memory buffer
+    if isinstance(pdf, BytesIO):
+        pdf.seek(0)
+        reader = PdfReader(pdf)
+    else:
+        reader = PdfReader(str(pdf))
+    assert len(reader.pages) == 1
+    return reader.pages[0].extract_text() or ""
+
+
 def test_invoice_pdf_drawn(tmp_path: Path) -> None:
     # Arrange: sample data with 3 items and dd-mm-yyyy date
     items = [
@@ -48,9 +75,13 @@ def test_invoice_pdf_drawn(tmp_path: Path) -> None:
     assert math.isclose(width, a4w, rel_tol=0, abs_tol=1.0)
     assert math.isclose(height, a4h, rel_tol=0, abs_tol=1.0)
 
+    # Invoice date is recorded once in the document keywords
+    keywords = str((reader.metadata or {}).get("/Keywords", ""))
+    assert f"Date: {date_str}" in keywords
+
     # Extract text and verify date and total math are present
     text = page.extract_text() or ""
-    assert f"Date: {date_str}" in text
+    assert "Date:" in text and date_str in text
     import re
     # Allow potential newline between label and value in extracted text
     assert re.search(rf"Total:\s*{expected_total:.2f}", text) is not None
@@ -58,3 +89,65 @@ def test_invoice_pdf_drawn(tmp_path: Path) -> None:
     # Sanity-check headers exist for right-aligned numeric columns
     # (alignment is enforced by drawRightString in implementation)
     assert "Qty" in text and "Rate" in text and "Amount" in text
+
+
+@pytest.mark.parametrize("total", [0, float("nan"), float("inf"), float("-inf")])
+def test_invoice_pdf_sums_items_when_total_is_unusable(total: float) -> None:
+    import re
+
+    data = _sample_data(
+        items=[{"description": "Item A", "qty": 2, "rate": 5.0, "amount": 10.0}],
+        total=total,
+    )
+    buf = BytesIO()
+    build_invoice_pdf(buf, data)
+
+    assert re.search(r"Total:\s*10\.00", _pdf_text(buf)) is not None
+
+
+def test_estimate_height_matches_built_table() -> None:
+    # The table is laid out once using this estimate instead of a probe build
+    from app.pdf.table_layout import build_invoice_table, estimate_height
+
+    content_width = 170 * 72 / 25.4
+    for n in (0, 1, 7):
+        lines = [
+            {"sl": f"{i + 1}.", "description": f"Item {i}", "qty": 1, "rate": 10.0, "amount": 10.0}
+            for i in range(n)
+        ]
+        table = build_invoice_table(lines, 10.0 * n, content_width)
+        _w, h = table.wrap(content_width, 10_000)
+        assert math.isclose(h, estimate_height(n), abs_tol=1e-6)
+
+
+def test_invoice_pdfs_with_worker_processes(tmp_path: Path) -> None:
+    from app.pdf.pdf_draw import build_invoice_pdfs
+
+    jobs = [
+        (
+            tmp_path / f"batch-{n}.pdf",
+            _sample_data(
+                invoice={"number": f"KMC-01{n}", "date": "11-08-2025"},
+                customer={"name": f"Batch Customer {n}"},
+            ),
+        )
+        for n in range(3)
+    ]
+    build_invoice_pdfs(jobs, max_workers=2)
+
+    for n, (out_pdf, _data) in enumerate(jobs):
+        assert f"Batch Customer {n}" in _pdf_text(out_pdf)
+
+
+def test_invoice_pdf_to_stream() -> None:
+    buf = BytesIO()
+    build_invoice_pdf(buf, _sample_data())
+
+    assert "Stream Customer" in _pdf_text(buf)
+
+
+def test_invoice_pdfs_rejects_stream_with_worker_processes() -> None:
+    from app.pdf.pdf_draw import build_invoice_pdfs
+
+    with pytest.raises(TypeError):
+        build_invoice_pdfs([(BytesIO(), _sample_data())], max_workers=2)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import pytest
+
+
+pytest.importorskip("PySide6")
+pytest.importorskip("pytestqt")
+
+
+def _assert_subtotal_matches(widget) -> None:  # type: ignore[no-untyped-def]
+    expected = sum(i["amount"] for i in widget.get_items())
+    assert widget.subtotal() == pytest.approx(expected)
+
+
+def test_running_subtotal_tracks_row_changes(qtbot):  # type: ignore[reportUnknownParameterType]
+    from app.widgets.line_items_widget import LineItemsWidget
+
+    widget = LineItemsWidget()
+    qtbot.addWidget(widget)
+    _assert_subtotal_matches(widget)
+
+    # Add rows
+    widget.add_row("Item A", 2, 5.0)
+    widget.add_row("Item B", 1.5, 0.07)
+    widget.add_row("Item C", 3, 20.0)
+    _assert_subtotal_matches(widget)
+
+    # Edit a qty and a rate
+    rows = [widget.vbox.itemAt(i).widget() for i in range(widget.vbox.count())]
+    rows[1].qty_spin.setValue(4)
+    _assert_subtotal_matches(widget)
+    rows[3].rate_spin.setValue(12.5)
+    _assert_subtotal_matches(widget)
+
+    # Remove a middle row; rows below it are renumbered
+    widget.remove_row(rows[2])
+    _assert_subtotal_matches(widget)
+    assert [widget.vbox.itemAt(i).widget().lbl_sl.text() for i in range(widget.vbox.count())] == ["1", "2", "3"]
+
+    # Replace all rows, then reset to a single empty row
+    widget.set_items([{"description": "X", "qty": 1, "rate": 99.99}, {"description": "Y", "qty": 2, "rate": 0.5}])
+    _assert_subtotal_matches(widget)
+    assert widget.subtotal() == pytest.approx(100.99)
+    widget.set_items()
+    _assert_subtotal_matches(widget)
+    assert widget.subtotal() == 0
@@ -7,6 +7,7 @@ from pathlib import Path
 import os
 import sys
 from datetime import date
+from io import BytesIO
 from importlib import import_module
 import pkgutil
 
@@ -117,13 +118,15 @@ def db_and_pdf_checks(tmp_dir: Path) -> None:
             'total': 10.35,
         }
         build_invoice_pdf(out_pdf, data)
-        if out_pdf.exists() and out_pdf.stat().st_size > 0:
-            _ok(f"Built PDF {out_pdf.name} ({out_pdf.stat().st_size} bytes)")
+        # Read the small PDF back in one call and parse it from memory
+        pdf_bytes = out_pdf.read_bytes() if out_pdf.exists() else b""
+        if pdf_bytes:
+            _ok(f"Built PDF {out_pdf.name} ({len(pdf_bytes)} bytes)")
         else:
             _fail("PDF not created or empty")
             return
         # Basic text extraction
-        txt = PdfReader(str(out_pdf)).pages[0].extract_text() or ""
+        txt = PdfReader(BytesIO(pdf_bytes)).pages[0].extract_text() or ""
         if "Date:" in txt and "Total:" in txt:
             _ok("PDF contains expected labels (Date/Total)")
         else: